@@ -6,7 +6,10 @@ from models.utils import measure_time
 from models.maze import Maze
 from models.tree import Tree
 from models.beam_search import BeamSearchSolver, find_beam_search_max_size
-from models.ant_system import AntSystemSolver, find_ant_system_ants_count
+from models.ant_system import (
+    AntSystemSolver, find_ant_system_ants_count, compare_pheromone_strategies
+)
+from models.pheromones import MaxMinStrategy
 
 
 if __name__ == "__main__":
@@ -30,7 +33,17 @@ if __name__ == "__main__":
     with measure_time("ant system"):
         ass = AntSystemSolver(ant_steps=10000000, ants_count=1000)
         path = ass.solve(tree, verbose=True)
+        # path = ass.solve(tree, verbose=True, checkpoint_path="AS-Large1.npz")
+        # path = ass.resume(tree, "AS-Large1.npz", verbose=True)
         print(len(path))
     # maze.save(path, 'passed-mazes/AS-Small1.bmp')
 
     # find_beam_search_max_size(tree)
+
+    # with measure_time("max-min ant system"):
+    #     ass = AntSystemSolver(ant_steps=10000000, ants_count=1000,
+    #                           strategy=MaxMinStrategy(), generation_size=10)
+    #     path = ass.solve(tree, verbose=True)
+    #     print(len(path))
+
+    # compare_pheromone_strategies(tree, target_length=7000)
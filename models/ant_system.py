@@ -1,29 +1,96 @@
-from random import random, seed
-from collections import defaultdict
+from random import random, seed, getstate, setstate
+
+import numpy as np
 
 from .utils import measure_time
+from .checkpoint import (
+    Checkpointer, pack_path, unpack_path, pack_random_state,
+    unpack_random_state
+)
+from .pheromones import (
+    AntSystemStrategy, ElitistStrategy, RankBasedStrategy, MaxMinStrategy
+)
 
 
 class AntSystemSolver:
-    def __init__(self, ant_steps, ants_count):
+    def __init__(self, ant_steps, ants_count, strategy=None, generation_size=1):
         self._ant_steps = ant_steps
         self._ants_count = ants_count
+        self._strategy = (
+            strategy if strategy is not None else AntSystemStrategy()
+        )
+        self._generation_size = generation_size
 
-        self._r = 0.1
         self._a = 0.2
         self._c = 1.0
-        self._q = 1.0
-        self._f = lambda length: length**0.7
 
-    def solve(self, tree, verbose=False):
+    def solve(self, tree, verbose=False, target_length=None,
+              checkpoint_path=None, checkpoint_interval=60.0):
+        """
+        Ant optimization algorithm on the tree. Pheromones are updated by
+        the strategy after every generation of generation_size ants. If
+        target_length is given the search stops once it is reached. If
+        checkpoint_path is given the state is saved there at the end of
+        a generation every checkpoint_interval seconds.
         """
-        Ant optimization algorithm on the tree.
+        self._strategy.set_tree(tree)
+        return self._solve(
+            tree, 0, [], 0, verbose, target_length,
+            checkpoint_path, checkpoint_interval
+        )
+
+    def resume(self, tree, checkpoint_path, verbose=False, target_length=None,
+               checkpoint_interval=60.0):
         """
-        pheromones_map = defaultdict(int)
-        best_path = []
-        best_path_length = 0
+        Continues solve from the checkpoint. The solver must be created
+        with the same parameters, then the result is the same as
+        of the uninterrupted run, also if it has stopped on target_length
+        right at the checkpoint. New checkpoints go to the same file.
+        """
+        state = Checkpointer.load(checkpoint_path)
+
+        # Other strategy would silently ignore a part of the state
+        strategy_name = state.pop("strategy_name").item()
+        if strategy_name != type(self._strategy).__name__:
+            raise ValueError(
+                f"checkpoint is made with {strategy_name}, "
+                f"not {type(self._strategy).__name__}"
+            )
+
+        strategy_state = {
+            key[len("strategy_"):]: value.item()
+            for key, value in state.items()
+            if key.startswith("strategy_")
+        }
+        strategy_state["trails"] = state["trails"]
+        self._strategy.set_tree(tree)
+        self._strategy.set_state(strategy_state)
+        setstate(unpack_random_state(
+            state["random_state"], state["random_gauss_next"]
+        ))
+
+        # Nothing to continue if the run has stopped at the checkpoint
+        idx_from = state["idx_count"].item()
+        if state["is_finished"].item():
+            idx_from = self._ants_count
+
+        return self._solve(
+            tree, idx_from, unpack_path(state["best_path"]),
+            state["best_path_length"].item(), verbose, target_length,
+            checkpoint_path, checkpoint_interval
+        )
+
+    def _solve(self, tree, idx_from, best_path, best_path_length, verbose,
+               target_length, checkpoint_path, checkpoint_interval):
+        checkpointer = None
+        if checkpoint_path is not None:
+            checkpointer = Checkpointer(checkpoint_path, checkpoint_interval)
+
+        # Successful paths of the current generation
+        paths = []
+        lengths = []
 
-        for idx_count in range(self._ants_count):
+        for idx_count in range(idx_from, self._ants_count):
             # Simulate ant
             path = [tree.begin]
             for idx_step in range(self._ant_steps):
@@ -34,9 +101,7 @@ class AntSystemSolver:
                     coords_next.append(coord)
 
                 # Choose random coord
-                coord = self._pheromones_choice(
-                    path[-1], coords_next, pheromones_map
-                )
+                coord = self._pheromones_choice(path[-1], coords_next)
 
                 # Add coord or delete extra part in the path
                 try:
@@ -54,8 +119,9 @@ class AntSystemSolver:
                 # Get path_length
                 path_length = tree.get_path_length(path)
 
-                # Evolve pheromones
-                self._pheromones_evolve(pheromones_map, path, path_length)
+                # Keep the path for the pheromones update
+                paths.append(path)
+                lengths.append(path_length)
 
                 # Update best_path
                 if best_path_length < path_length:
@@ -67,18 +133,65 @@ class AntSystemSolver:
                 print(f"Best path: {best_path_length}")
                 print()
 
+            # Evolve pheromones at the end of the generation
+            if (idx_count + 1) % self._generation_size == 0 or \
+                    idx_count + 1 == self._ants_count:
+                self._strategy.update(
+                    paths, lengths, best_path, best_path_length
+                )
+                paths = []
+                lengths = []
+
+                is_finished = target_length is not None and \
+                    best_path_length >= target_length
+
+                # Save state between generations, the pheromones array
+                # is copied here and written in the background
+                if checkpointer is not None and checkpointer.is_due():
+                    checkpointer.save(self._pack_state, (
+                        idx_count + 1, is_finished, best_path,
+                        best_path_length, type(self._strategy).__name__,
+                        self._strategy.get_state(), getstate()
+                    ))
+
+                if is_finished:
+                    break
+
+        if checkpointer is not None:
+            checkpointer.wait()
+
         # Raise error if a solution has not been found
         if not best_path:
             raise Exception("solution not found")
 
         return tree.build_full_path(best_path)
 
-    def _pheromones_choice(self, coord_current, coords_next, pheromones_map):
+    @staticmethod
+    def _pack_state(snapshot):
+        idx_count, is_finished, best_path, best_path_length, strategy_name, \
+            strategy_state, random_state = snapshot
+
+        random_internal, random_gauss_next = pack_random_state(random_state)
+        arrays = {
+            "idx_count": np.int64(idx_count),
+            "is_finished": np.bool_(is_finished),
+            "best_path": pack_path(best_path),
+            "best_path_length": np.int64(best_path_length),
+            "strategy_name": np.str_(strategy_name),
+            "trails": strategy_state.pop("trails"),
+            "random_state": random_internal,
+            "random_gauss_next": random_gauss_next,
+        }
+        for key, value in strategy_state.items():
+            arrays["strategy_" + key] = np.asarray(value)
+        return arrays
+
+    def _pheromones_choice(self, coord_current, coords_next):
         if len(coords_next) == 1:
             return coords_next[0]
 
         values = [
-            pheromones_map[coord_current, coord]
+            self._strategy.get(coord_current, coord)
             for coord in coords_next
         ]
         parts = [(self._c + value)**self._a for value in values]
@@ -89,20 +202,6 @@ class AntSystemSolver:
             if agg >= random_value:
                 return coords_next[idx]
 
-    def _pheromones_evolve(self, pheromones_map, path, path_length=None, tree=None):
-        # path_length is passed for optimization, if it is already know
-        # there's no need to calculate it again
-        if path_length is None:
-            path_length = tree.get_path_length(path)
-
-        # Tolerance for all pheromones everywhere
-        for coord1, coord2 in pheromones_map.keys():
-            pheromones_map[coord1, coord2] *= (1 - self._r)
-
-        # Changes pheromones only in the places where ant passed
-        for coord1, coord2 in zip(path[:-1], path[1:]):
-            pheromones_map[coord1, coord2] += self._f(path_length)
-
 
 def find_ant_system_ants_count(tree, ant_steps=1000000):
     """
@@ -132,3 +231,37 @@ def find_ant_system_ants_count(tree, ant_steps=1000000):
         print(f"Best length is {length_best} with ants_count = {ants_count_best}")
 
         print()
+
+
+def compare_pheromone_strategies(tree, target_length, strategies=None,
+                                 ant_steps=1000000, ants_count=1000,
+                                 generation_size=10):
+    """
+    Runs ant system solver with different pheromone strategies on the same
+    tree to compare the time to reach target_length.
+    """
+    if strategies is None:
+        strategies = {
+            "ant system": AntSystemStrategy(),
+            "elitist": ElitistStrategy(),
+            "rank-based": RankBasedStrategy(),
+            "max-min": MaxMinStrategy(),
+        }
+
+    for name, strategy in strategies.items():
+        seed(0)
+
+        with measure_time(name):
+            try:
+                ass = AntSystemSolver(
+                    ant_steps=ant_steps, ants_count=ants_count,
+                    strategy=strategy, generation_size=generation_size
+                )
+                path = ass.solve(tree, target_length=target_length)
+                print("Result length:", len(path))
+                print("Target reached:", len(path) - 1 >= target_length)
+
+            except Exception as exc:
+                print(exc)
+
+        print()
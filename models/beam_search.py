@@ -1,6 +1,11 @@
 from operator import itemgetter
 
+import numpy as np
+
 from .utils import measure_time
+from .checkpoint import (
+    Checkpointer, pack_path, unpack_path, pack_paths, unpack_paths
+)
 
 
 class BeamSearchSolver:
@@ -8,17 +13,44 @@ class BeamSearchSolver:
         self._max_size = max_size
         self._max_count = max_count
 
-    def solve(self, tree, verbose=False):
+    def solve(self, tree, verbose=False, checkpoint_path=None,
+              checkpoint_interval=60.0):
         """
-        Beam search algorithm on the tree with limits.
+        Beam search algorithm on the tree with limits. If checkpoint_path
+        is given the frontier is saved there after an iteration every
+        checkpoint_interval seconds.
         """
-        paths = [[tree.begin]]
-        lengths = [0]
-
-        best_path = []
-        best_length = 0
+        return self._solve(
+            tree, 0, [[tree.begin]], [0], [], 0, verbose,
+            checkpoint_path, checkpoint_interval
+        )
 
-        for idx_count in range(self._max_count):
+    def resume(self, tree, checkpoint_path, verbose=False,
+               checkpoint_interval=60.0):
+        """
+        Continues solve from the checkpoint. The solver must be created
+        with the same parameters, then the result is the same as
+        of the uninterrupted run. New checkpoints go to the same file.
+        """
+        state = Checkpointer.load(checkpoint_path)
+        return self._solve(
+            tree, state["idx_count"].item(),
+            unpack_paths(state["paths_coords"], state["paths_offsets"]),
+            state["lengths"].tolist(), unpack_path(state["best_path"]),
+            state["best_length"].item(), verbose,
+            checkpoint_path, checkpoint_interval
+        )
+
+    def _solve(self, tree, idx_from, paths, lengths, best_path, best_length,
+               verbose, checkpoint_path, checkpoint_interval):
+        checkpointer = None
+        if checkpoint_path is not None:
+            checkpointer = Checkpointer(checkpoint_path, checkpoint_interval)
+
+        # Keeps idx_count defined if the checkpoint was on the last iteration
+        idx_count = idx_from - 1
+
+        for idx_count in range(idx_from, self._max_count):
             paths_new = []
             lengths_new = []
 
@@ -58,6 +90,16 @@ class BeamSearchSolver:
             if not paths:
                 break
 
+            # Save state between iterations, paths are never changed
+            # in place, so they are packed in the background as is
+            if checkpointer is not None and checkpointer.is_due():
+                checkpointer.save(self._pack_state, (
+                    idx_count + 1, paths, lengths, best_path, best_length
+                ))
+
+        if checkpointer is not None:
+            checkpointer.wait()
+
         if verbose:
             print(f"idx_count = {idx_count + 1}")
 
@@ -68,6 +110,19 @@ class BeamSearchSolver:
         # Extract coords of the best path
         return tree.build_full_path(best_path)
 
+    @staticmethod
+    def _pack_state(snapshot):
+        idx_count, paths, lengths, best_path, best_length = snapshot
+        paths_coords, paths_offsets = pack_paths(paths)
+        return {
+            "idx_count": np.int64(idx_count),
+            "paths_coords": paths_coords,
+            "paths_offsets": paths_offsets,
+            "lengths": np.array(lengths, dtype=np.int64),
+            "best_path": pack_path(best_path),
+            "best_length": np.int64(best_length),
+        }
+
 
 def find_beam_search_max_size(tree, max_size_from=1, max_size_to=200,
                               max_count=1000):
@@ -0,0 +1,143 @@
+import os
+from time import time
+from threading import Thread
+
+import numpy as np
+
+
+class Checkpointer:
+    """
+    Periodically saves solver state to a binary NPZ file. The state is
+    packed and written in a background thread to a temporary file which
+    then atomically replaces the checkpoint.
+    """
+
+    def __init__(self, filepath, interval=60.0):
+        self._filepath = filepath
+        self._interval = interval
+        self._time_last = time()
+        self._thread = None
+        self._error = None
+
+    def is_due(self):
+        """
+        Checks if the interval since the last checkpoint has passed.
+        """
+        return time() - self._time_last >= self._interval
+
+    def save(self, pack, snapshot):
+        """
+        Starts writing the checkpoint in the background. pack converts
+        the snapshot to a dictionary of numpy arrays and is called in
+        the background thread, so the snapshot must not be changed later.
+        The checkpoint is skipped if the previous one is still being written,
+        so the solver never waits for the disk. Raises the error of
+        the previous checkpoint if it has failed.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._raise_error()
+
+        self._time_last = time()
+        self._thread = Thread(target=self._write, args=(pack, snapshot))
+        self._thread.start()
+        return True
+
+    def wait(self):
+        """
+        Waits for the checkpoint being written and raises its error
+        if it has failed.
+        """
+        if self._thread is not None:
+            self._thread.join()
+        self._raise_error()
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Loads the checkpoint as a dictionary of numpy arrays.
+        """
+        with np.load(filepath, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+
+    def _write(self, pack, snapshot):
+        filepath_tmp = self._filepath + ".tmp"
+        try:
+            arrays = pack(snapshot)
+            with open(filepath_tmp, "wb") as f:
+                np.savez(f, **arrays)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(filepath_tmp, self._filepath)
+
+        except Exception as exc:
+            # Keep the error for the solver thread and the last good checkpoint
+            self._error = exc
+            if os.path.exists(filepath_tmp):
+                os.remove(filepath_tmp)
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+def pack_path(path):
+    """
+    Packs a list of coords into an array of shape (n, 2).
+    """
+    return np.array(path, dtype=np.int64).reshape(-1, 2)
+
+
+def unpack_path(array):
+    """
+    Unpacks an array of shape (n, 2) into a list of coords.
+    """
+    return [tuple(coord) for coord in array.tolist()]
+
+
+def pack_paths(paths):
+    """
+    Packs a list of paths into a flat array of coords and an array of
+    offsets of each path in it.
+    """
+    offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(path) for path in paths])
+    coords = [coord for path in paths for coord in path]
+    return pack_path(coords), offsets
+
+
+def unpack_paths(coords, offsets):
+    """
+    Unpacks a list of paths packed by pack_paths.
+    """
+    coords = unpack_path(coords)
+    offsets = offsets.tolist()
+    return [
+        coords[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)
+    ]
+
+
+def pack_random_state(state):
+    """
+    Packs a state of the random module into an array of integers and
+    the next gaussian value (NaN if there is no one).
+    """
+    version, internal, gauss_next = state
+    return (
+        np.array((version,) + internal, dtype=np.int64),
+        np.float64(np.nan if gauss_next is None else gauss_next),
+    )
+
+
+def unpack_random_state(internal, gauss_next):
+    """
+    Unpacks a state of the random module packed by pack_random_state.
+    """
+    internal = internal.tolist()
+    gauss_next = gauss_next.item()
+    return (
+        internal[0],
+        tuple(internal[1:]),
+        None if np.isnan(gauss_next) else gauss_next,
+    )
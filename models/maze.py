@@ -2,6 +2,19 @@ import numpy as np
 from PIL import Image
 
 
+# Directions in the order of bits in the neighbours mask
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+# Available directions for every possible value of the neighbours mask
+_DIRECTIONS_BY_MASK = tuple(
+    tuple(
+        direction for bit, direction in enumerate(DIRECTIONS)
+        if mask >> bit & 1
+    )
+    for mask in range(1 << len(DIRECTIONS))
+)
+
+
 class Maze:
     """
     Maze object contains 2D numpy array of 0 (wall) and 1 (pass) and
@@ -15,6 +28,8 @@ class Maze:
         self._data = data
         self._begin = self._find_begin()
         self._end = self._find_end()
+        self._neighbours_mask = self._build_neighbours_mask()
+        self._degrees = self._build_degrees()
 
     def __repr__(self):
         return repr(self._data)
@@ -31,12 +46,56 @@ class Maze:
     def end(self):
         return self._end
 
+    @property
+    def neighbours_mask(self):
+        """
+        2D uint8 array with a 4-bit mask of open directions for every cell,
+        bit i is set if the neighbour in DIRECTIONS[i] is a pass.
+        """
+        return self._neighbours_mask
+
+    @property
+    def degrees(self):
+        """
+        2D uint8 array with the number of open neighbours for every cell.
+        """
+        return self._degrees
+
     def get_neighbours(self, coord):
         """
         Yields coordinates of neighbours in the maze for given coord.
         """
-        for direction in self.available_directions(coord):
-            yield self.next_coord(coord, direction)
+        x, y = coord
+        for dx, dy in _DIRECTIONS_BY_MASK[self._neighbours_mask[y, x]]:
+            yield (x + dx, y + dy)
+
+    def get_neighbours_many(self, coords):
+        """
+        Gets neighbours of many coords at once. Returns a tuple of two arrays:
+        indices of the source coords in the given sequence and coordinates of
+        their neighbours. Neighbours of each coord are ordered the same way
+        as in available_directions.
+        """
+        coords = np.asarray(coords, dtype=np.intp).reshape(-1, 2)
+        masks = self._neighbours_mask[coords[:, 1], coords[:, 0]]
+        bits = (masks[:, None] >> np.arange(len(DIRECTIONS))) & 1
+        idx, idx_direction = np.nonzero(bits)
+        neighbours = coords[idx] + np.array(DIRECTIONS)[idx_direction]
+        return idx, neighbours
+
+    def get_junctions(self):
+        """
+        Gets an array of coordinates of all pass cells with 3 or more
+        open neighbours.
+        """
+        return self._find_cells(self._degrees >= 3)
+
+    def get_dead_ends(self):
+        """
+        Gets an array of coordinates of all pass cells with exactly one
+        open neighbour.
+        """
+        return self._find_cells(self._degrees == 1)
 
     def available_directions(self, coord):
         """
@@ -44,16 +103,9 @@ class Maze:
         direction is a tuple like (0, -1), which means the direction with negative
         Y and same X.
         """
-        directions = []
-        if coord[0] + 1 < self.shape[1] and self._data[coord[1], coord[0] + 1]:
-            directions.append((1, 0))
-        if coord[1] + 1 < self.shape[0] and self._data[coord[1] + 1, coord[0]]:
-            directions.append((0, 1))
-        if coord[0] - 1 >= 0 and self._data[coord[1], coord[0] - 1]:
-            directions.append((-1, 0))
-        if coord[1] - 1 >= 0 and self._data[coord[1] - 1, coord[0]]:
-            directions.append((0, -1))
-        return directions
+        return list(
+            _DIRECTIONS_BY_MASK[self._neighbours_mask[coord[1], coord[0]]]
+        )
 
     def save(self, path, filepath):
         """
@@ -105,3 +157,33 @@ class Maze:
             np.where(self._data[-1, :] == 1)[0][0],
             self._data.shape[1] - 1
         )
+
+    def _build_neighbours_mask(self):
+        """
+        Calculates the mask of open directions for all cells at once.
+        """
+        is_pass = (self._data != 0).astype(np.uint8)
+        mask = np.zeros(self.shape, dtype=np.uint8)
+        mask[:, :-1] |= is_pass[:, 1:]  # (1, 0)
+        mask[:-1, :] |= is_pass[1:, :] << 1  # (0, 1)
+        mask[:, 1:] |= is_pass[:, :-1] << 2  # (-1, 0)
+        mask[1:, :] |= is_pass[:-1, :] << 3  # (0, -1)
+        return mask
+
+    def _build_degrees(self):
+        """
+        Calculates number of open neighbours for all cells by their masks.
+        """
+        bits_count = np.array(
+            [len(directions) for directions in _DIRECTIONS_BY_MASK],
+            dtype=np.uint8
+        )
+        return bits_count[self._neighbours_mask]
+
+    def _find_cells(self, condition):
+        """
+        Gets an array of (x, y) coordinates of pass cells satisfying
+        the condition given as a 2D boolean array.
+        """
+        ys, xs = np.nonzero((self._data != 0) & condition)
+        return np.stack([xs, ys], axis=1)
@@ -0,0 +1,223 @@
+from operator import itemgetter
+
+import numpy as np
+
+
+# Lower limit of the common scale of trails, after that the stored values
+# are renormalized to avoid float underflow
+_MIN_SCALE = 1e-100
+
+
+class PheromoneStrategy:
+    """
+    Base strategy of pheromone update for the ant system solver.
+
+    Trails are stored in a numpy array indexed by edge ids of the tree and
+    divided by a common scale, so evaporation of all trails is a single
+    multiplication of the scale and each update touches only the edges of
+    the deposited paths.
+    """
+
+    def __init__(self, evaporation=0.1, deposit=None):
+        self._r = evaporation
+        self._f = deposit if deposit is not None else self._default_deposit
+        self._edge_ids = {}
+        self.reset()
+
+    def set_tree(self, tree):
+        """
+        Indexes edges of the tree and resets trails.
+        """
+        self._edge_ids = tree.get_edge_ids()
+        self.reset()
+
+    def reset(self, initial=0.0):
+        """
+        Sets all trails to the initial value.
+        """
+        self._trails = np.full(len(self._edge_ids), initial)
+        self._scale = 1.0
+
+    def get(self, coord1, coord2):
+        """
+        Gets pheromone value on the edge from coord1 to coord2.
+        """
+        return self._trails.item(self._edge_ids[coord1, coord2]) * self._scale
+
+    def get_state(self):
+        """
+        Gets a snapshot of the strategy state as a dictionary with the array
+        of trails and scalar values.
+        """
+        return {
+            "trails": self._trails.copy(),
+            "scale": self._scale,
+        }
+
+    def set_state(self, state):
+        """
+        Restores the strategy state from get_state.
+        """
+        if len(state["trails"]) != len(self._edge_ids):
+            raise ValueError("trails do not match edges of the tree")
+        self._trails = state["trails"]
+        self._scale = state["scale"]
+
+    def update(self, paths, lengths, best_path, best_length):
+        """
+        Updates trails after a generation of ants. paths and lengths are
+        the successful paths of the generation, best_path and best_length
+        are the best found so far. Generations without successful ants
+        leave trails unchanged, like in the classic ant system.
+        """
+        if paths:
+            self._update(paths, lengths, best_path, best_length)
+
+    def _update(self, paths, lengths, best_path, best_length):
+        raise NotImplementedError
+
+    def _evaporate(self):
+        self._scale *= 1 - self._r
+        if self._scale < _MIN_SCALE:
+            self._trails *= self._scale
+            self._scale = 1.0
+
+    def _deposit(self, path, amount):
+        self._trails[self._get_path_ids(path)] += amount / self._scale
+
+    def _get_path_ids(self, path):
+        # Paths have no repeated nodes, so ids are unique
+        return [self._edge_ids[key] for key in zip(path[:-1], path[1:])]
+
+    @staticmethod
+    def _default_deposit(length):
+        return length**0.7
+
+
+class AntSystemStrategy(PheromoneStrategy):
+    """
+    Classic ant system: every successful ant deposits pheromones.
+    """
+
+    def _update(self, paths, lengths, best_path, best_length):
+        self._evaporate()
+        for path, length in zip(paths, lengths):
+            self._deposit(path, self._f(length))
+
+
+class ElitistStrategy(AntSystemStrategy):
+    """
+    Elitist ant system: every successful ant deposits pheromones and
+    the best path found so far gets an extra weighted deposit.
+    """
+
+    def __init__(self, elite_weight=5.0, **kwargs):
+        self._elite_weight = elite_weight
+        super().__init__(**kwargs)
+
+    def _update(self, paths, lengths, best_path, best_length):
+        super()._update(paths, lengths, best_path, best_length)
+        self._deposit(best_path, self._elite_weight * self._f(best_length))
+
+
+class RankBasedStrategy(PheromoneStrategy):
+    """
+    Rank-based ant system: only weight - 1 longest paths of the generation
+    deposit pheromones proportionally to their rank and the best path found
+    so far deposits with the full weight.
+    """
+
+    def __init__(self, weight=6, **kwargs):
+        self._weight = weight
+        super().__init__(**kwargs)
+
+    def _update(self, paths, lengths, best_path, best_length):
+        self._evaporate()
+
+        ranked = sorted(zip(paths, lengths), key=itemgetter(1), reverse=True)
+        for rank, (path, length) in enumerate(ranked[:self._weight - 1], 1):
+            self._deposit(path, (self._weight - rank) * self._f(length))
+
+        self._deposit(best_path, self._weight * self._f(best_length))
+
+
+class MaxMinStrategy(PheromoneStrategy):
+    """
+    MAX-MIN ant system: only the best ant deposits pheromones, trails are
+    bounded by [tau_min, tau_max] and reinitialised to tau_max when the best
+    length has not improved for stagnation_limit generations with successful
+    ants.
+    """
+
+    def __init__(self, ratio=0.01, stagnation_limit=50, use_best_so_far=False,
+                 **kwargs):
+        self._ratio = ratio
+        self._stagnation_limit = stagnation_limit
+        self._use_best_so_far = use_best_so_far
+        super().__init__(**kwargs)
+
+    def reset(self, initial=0.0):
+        super().reset(initial)
+        # Bounds are unknown until the first solution is found
+        if not initial:
+            self._tau_max = float("inf")
+            self._tau_min = 0.0
+            self._best_length = 0
+        self._stagnation = 0
+
+    def get(self, coord1, coord2):
+        value = super().get(coord1, coord2)
+        return min(max(value, self._tau_min), self._tau_max)
+
+    def get_state(self):
+        state = super().get_state()
+        state.update(
+            tau_max=self._tau_max,
+            tau_min=self._tau_min,
+            best_length=self._best_length,
+            stagnation=self._stagnation,
+        )
+        return state
+
+    def set_state(self, state):
+        super().set_state(state)
+        self._tau_max = state["tau_max"]
+        self._tau_min = state["tau_min"]
+        self._best_length = state["best_length"]
+        self._stagnation = state["stagnation"]
+
+    def _update(self, paths, lengths, best_path, best_length):
+        # Update bounds and restart trails with tau_max on the first solution
+        if best_length > self._best_length:
+            is_first = not self._best_length
+            self._best_length = best_length
+            self._tau_max = self._f(best_length) / self._r
+            self._tau_min = self._tau_max * self._ratio
+            self._stagnation = 0
+            if is_first:
+                self.reset(self._tau_max)
+        elif self._best_length:
+            self._stagnation += 1
+
+        # Reinitialise trails on stagnation, only with finite bounds
+        if self._best_length and \
+                self._stagnation >= self._stagnation_limit:
+            self.reset(self._tau_max)
+            return
+
+        self._evaporate()
+
+        if self._use_best_so_far:
+            path, length = best_path, best_length
+        else:
+            path, length = max(zip(paths, lengths), key=itemgetter(1))
+
+        self._deposit(path, self._f(length))
+
+    def _deposit(self, path, amount):
+        # Clamp only the touched edges, the rest is bounded in get
+        ids = self._get_path_ids(path)
+        self._trails[ids] = np.minimum(
+            self._trails[ids] + amount / self._scale,
+            self._tau_max / self._scale
+        )
@@ -45,6 +45,17 @@ class Tree:
         """
         return self._edges[node]
 
+    def get_edge_ids(self):
+        """
+        Gets a dictionary with (node1, node2) pairs of all edges as keys and
+        their consecutive ids as values.
+        """
+        edge_ids = {}
+        for node, edges in self._edges.items():
+            for edge in edges:
+                edge_ids[node, edge[-1]] = len(edge_ids)
+        return edge_ids
+
     def build_full_path(self, path):
         """
         Builds full path as a list of all coordinates in the maze.
@@ -0,0 +1,55 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+from models.maze import Maze
+from models.tree import Tree
+
+
+def generate_maze(size, seed):
+    """
+    Generates a maze of size x size cells by depth first search with some
+    extra walls removed, so it has loops.
+    """
+    rnd = Random(seed)
+    n = 2 * size + 1
+    data = np.zeros((n, n), dtype=np.int32)
+
+    stack = [(0, 0)]
+    seen = {(0, 0)}
+    data[1, 1] = 1
+    while stack:
+        x, y = stack[-1]
+        cells_next = [
+            (x + dx, y + dy) for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1))
+            if 0 <= x + dx < size and 0 <= y + dy < size
+            and (x + dx, y + dy) not in seen
+        ]
+        if not cells_next:
+            stack.pop()
+            continue
+        x_next, y_next = rnd.choice(cells_next)
+        seen.add((x_next, y_next))
+        data[2 * y_next + 1, 2 * x_next + 1] = 1
+        data[y + y_next + 1, x + x_next + 1] = 1
+        stack.append((x_next, y_next))
+
+    for _ in range(size * size // 6):
+        i, j = rnd.randrange(1, n - 1), rnd.randrange(1, n - 1)
+        if (i + j) % 2 == 1:
+            data[i, j] = 1
+
+    data[0, 1] = 1
+    data[-1, n - 2] = 1
+    return data
+
+
+@pytest.fixture
+def maze():
+    return Maze(generate_maze(25, 0))
+
+
+@pytest.fixture
+def tree(maze):
+    return Tree.build_from_maze(maze)
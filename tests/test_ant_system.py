@@ -0,0 +1,43 @@
+import hashlib
+from random import seed
+
+import pytest
+
+from models.maze import Maze
+from models.tree import Tree
+from models.ant_system import AntSystemSolver
+
+from .conftest import generate_maze
+
+
+def path_digest(path):
+    return hashlib.md5(
+        repr([(int(x), int(y)) for x, y in path]).encode()
+    ).hexdigest()
+
+
+# Results of the solver before pheromone strategies were introduced
+BASELINE = [
+    (0, 60, 0, 363, "2d34531edcdeaf93a2a9226097908176"),
+    (0, 60, 1, 507, "24bc140dd745b8ebb8e93b4765c14f16"),
+    (0, 100, 0, 439, "a6620bac2e5fd3d090d199b19a62cb96"),
+    (0, 100, 1, 435, "0b7a0b0e9f0901767d1d4707ad6e85c1"),
+    (1, 60, 0, 351, "7f20ace3b9f4ca2cbf619f69bb4e279a"),
+    (1, 60, 1, 407, "be34aa2a46bf019ab3ae9f8cb0d96322"),
+    (1, 100, 0, 439, "9af37a46a092835eb3b7d1436668c372"),
+    (1, 100, 1, 387, "2abd8479ce29d0c876f4e458a9421a08"),
+]
+
+
+@pytest.mark.parametrize(
+    "maze_seed, ant_steps, random_seed, length, digest", BASELINE
+)
+def test_default_strategy_matches_baseline(maze_seed, ant_steps, random_seed,
+                                           length, digest):
+    tree = Tree.build_from_maze(Maze(generate_maze(25, maze_seed)))
+
+    seed(random_seed)
+    path = AntSystemSolver(ant_steps=ant_steps, ants_count=40).solve(tree)
+
+    assert len(path) == length
+    assert path_digest(path) == digest
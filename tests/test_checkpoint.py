@@ -0,0 +1,100 @@
+import os
+from random import seed
+
+import pytest
+
+from models.checkpoint import Checkpointer
+from models.ant_system import AntSystemSolver
+from models.beam_search import BeamSearchSolver
+from models.pheromones import (
+    AntSystemStrategy, ElitistStrategy, RankBasedStrategy, MaxMinStrategy
+)
+
+
+STRATEGIES = [
+    AntSystemStrategy, ElitistStrategy, RankBasedStrategy, MaxMinStrategy
+]
+
+
+def make_solver(strategy_cls, ants_count=60):
+    return AntSystemSolver(
+        ant_steps=300, ants_count=ants_count, strategy=strategy_cls(),
+        generation_size=4
+    )
+
+
+@pytest.mark.parametrize("strategy_cls", STRATEGIES)
+def test_ant_system_resume_equals_full_run(tree, tmp_path, strategy_cls):
+    checkpoint_path = str(tmp_path / "ant_system.npz")
+
+    seed(0)
+    path = make_solver(strategy_cls).solve(tree)
+
+    # Interrupted run, every generation is checkpointed
+    seed(0)
+    make_solver(strategy_cls, ants_count=24).solve(
+        tree, checkpoint_path=checkpoint_path, checkpoint_interval=0
+    )
+
+    seed(1)
+    assert make_solver(strategy_cls).resume(tree, checkpoint_path) == path
+
+
+def test_ant_system_resume_after_target_length(tree, tmp_path):
+    checkpoint_path = str(tmp_path / "ant_system.npz")
+
+    seed(0)
+    path = make_solver(AntSystemStrategy).solve(
+        tree, target_length=200, checkpoint_path=checkpoint_path,
+        checkpoint_interval=0
+    )
+
+    # The run has stopped at the last checkpoint, so resume must not
+    # continue with more ants even without target_length
+    assert make_solver(AntSystemStrategy).resume(tree, checkpoint_path) == path
+
+
+def test_ant_system_resume_with_other_strategy(tree, tmp_path):
+    checkpoint_path = str(tmp_path / "ant_system.npz")
+
+    seed(0)
+    make_solver(MaxMinStrategy, ants_count=8).solve(
+        tree, checkpoint_path=checkpoint_path, checkpoint_interval=0
+    )
+
+    with pytest.raises(ValueError):
+        make_solver(AntSystemStrategy).resume(tree, checkpoint_path)
+
+
+@pytest.mark.parametrize("max_count", [20, 1000])
+def test_beam_search_resume_equals_full_run(tree, tmp_path, max_count):
+    checkpoint_path = str(tmp_path / "beam_search.npz")
+
+    path = BeamSearchSolver(max_size=500, max_count=1000).solve(tree)
+
+    try:
+        BeamSearchSolver(max_size=500, max_count=max_count).solve(
+            tree, checkpoint_path=checkpoint_path, checkpoint_interval=0
+        )
+    except Exception:
+        pass
+
+    assert BeamSearchSolver(max_size=500, max_count=1000).resume(
+        tree, checkpoint_path, verbose=True
+    ) == path
+
+
+def test_failed_write_is_reported(tmp_path):
+    checkpoint_path = str(tmp_path / "state.npz")
+    checkpointer = Checkpointer(checkpoint_path, interval=0)
+
+    def pack(snapshot):
+        open(checkpoint_path + ".tmp", "wb").close()
+        raise OSError("disk is full")
+
+    checkpointer.save(pack, None)
+    with pytest.raises(OSError):
+        checkpointer.wait()
+
+    assert not os.path.exists(checkpoint_path + ".tmp")
+    assert not os.path.exists(checkpoint_path)
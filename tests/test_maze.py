@@ -0,0 +1,75 @@
+import numpy as np
+
+from models.maze import Maze
+
+from .conftest import generate_maze
+
+
+def available_directions_reference(data, coord):
+    # Per-cell implementation the neighbours mask replaced
+    directions = []
+    if coord[0] + 1 < data.shape[1] and data[coord[1], coord[0] + 1]:
+        directions.append((1, 0))
+    if coord[1] + 1 < data.shape[0] and data[coord[1] + 1, coord[0]]:
+        directions.append((0, 1))
+    if coord[0] - 1 >= 0 and data[coord[1], coord[0] - 1]:
+        directions.append((-1, 0))
+    if coord[1] - 1 >= 0 and data[coord[1] - 1, coord[0]]:
+        directions.append((0, -1))
+    return directions
+
+
+def random_data(seed):
+    rng = np.random.default_rng(seed)
+    data = (rng.random((17, 23)) > 0.4).astype(np.int32)
+    data[0, 3] = 1
+    data[-1, 5] = 1
+    return data
+
+
+def all_coords(maze):
+    return [(x, y) for y in range(maze.shape[0]) for x in range(maze.shape[1])]
+
+
+def test_available_directions_match_reference():
+    for seed in range(5):
+        data = random_data(seed)
+        maze = Maze(data)
+        for coord in all_coords(maze):
+            assert maze.available_directions(coord) == \
+                available_directions_reference(data, coord)
+
+
+def test_degrees_count_available_directions():
+    maze = Maze(random_data(0))
+    for x, y in all_coords(maze):
+        assert maze.degrees[y, x] == len(maze.available_directions((x, y)))
+
+
+def test_get_neighbours_many_matches_get_neighbours():
+    maze = Maze(random_data(1))
+    coords = all_coords(maze)
+
+    idx, neighbours = maze.get_neighbours_many(coords)
+
+    expected = [
+        (i, neighbour)
+        for i, coord in enumerate(coords)
+        for neighbour in maze.get_neighbours(coord)
+    ]
+    assert [
+        (int(i), (int(x), int(y))) for i, (x, y) in zip(idx, neighbours)
+    ] == expected
+
+
+def test_junctions_and_dead_ends():
+    data = generate_maze(10, 0)
+    maze = Maze(data)
+
+    junctions = {tuple(coord) for coord in maze.get_junctions().tolist()}
+    dead_ends = {tuple(coord) for coord in maze.get_dead_ends().tolist()}
+
+    for x, y in all_coords(maze):
+        degree = len(maze.available_directions((x, y)))
+        assert ((x, y) in junctions) == bool(data[y, x] and degree >= 3)
+        assert ((x, y) in dead_ends) == bool(data[y, x] and degree == 1)
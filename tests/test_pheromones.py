@@ -0,0 +1,100 @@
+import pytest
+
+from models.tree import Tree
+from models.pheromones import (
+    AntSystemStrategy, ElitistStrategy, RankBasedStrategy, MaxMinStrategy
+)
+
+
+PATH = [(0, 0), (1, 0), (2, 0), (3, 0)]
+EDGES = list(zip(PATH[:-1], PATH[1:]))
+OTHER_EDGE = ((5, 5), (5, 6))
+
+STRATEGIES = [
+    AntSystemStrategy, ElitistStrategy, RankBasedStrategy, MaxMinStrategy
+]
+
+
+def make_strategy(strategy_cls, **kwargs):
+    edges = {}
+    for coord1, coord2 in EDGES + [OTHER_EDGE]:
+        edges.setdefault(coord1, []).append([coord1, coord2])
+        edges.setdefault(coord2, []).append([coord2, coord1])
+
+    strategy = strategy_cls(**kwargs)
+    strategy.set_tree(Tree(edges, PATH[0], PATH[-1]))
+    return strategy
+
+
+def get_values(strategy):
+    return [strategy.get(coord1, coord2) for coord1, coord2 in EDGES]
+
+
+@pytest.mark.parametrize("strategy_cls", STRATEGIES)
+def test_empty_generations_leave_trails_unchanged(strategy_cls):
+    strategy = make_strategy(strategy_cls)
+    strategy.update([PATH], [30], PATH, 30)
+    values = get_values(strategy)
+
+    for _ in range(20):
+        strategy.update([], [], PATH, 30)
+
+    assert get_values(strategy) == values
+
+
+def test_ant_system_deposit_and_evaporation():
+    strategy = make_strategy(
+        AntSystemStrategy,
+        evaporation=0.1, deposit=lambda length: length / 4
+    )
+    strategy.update([PATH], [32], PATH, 32)
+    assert get_values(strategy) == pytest.approx([8.0] * 3)
+
+    strategy.update([PATH[:2]], [32], PATH, 32)
+    assert get_values(strategy) == pytest.approx(
+        [8.0 * 0.9 + 8.0, 8.0 * 0.9, 8.0 * 0.9]
+    )
+
+
+def test_max_min_empty_generations_before_first_solution():
+    strategy = make_strategy(MaxMinStrategy, stagnation_limit=50)
+    for _ in range(60):
+        strategy.update([], [], [], 0)
+
+    assert all(value < float("inf") for value in get_values(strategy))
+
+
+def test_max_min_bounds():
+    strategy = make_strategy(
+        MaxMinStrategy,
+        evaporation=0.1, ratio=0.01, stagnation_limit=1000
+    )
+    strategy.update([PATH], [30], PATH, 30)
+    tau_max = 30**0.7 / 0.1
+
+    # Trails start from tau_max after the first solution
+    assert get_values(strategy) == pytest.approx([tau_max] * 3)
+    assert strategy.get(*OTHER_EDGE) == pytest.approx(0.9 * tau_max)
+
+    for _ in range(100):
+        strategy.update([PATH[:2]], [30], PATH, 30)
+        assert all(
+            0.01 * tau_max <= value <= tau_max
+            for value in get_values(strategy)
+        )
+    assert strategy.get(*EDGES[-1]) == pytest.approx(0.01 * tau_max)
+
+
+def test_max_min_reinitialises_on_stagnation():
+    strategy = make_strategy(
+        MaxMinStrategy, evaporation=0.1, stagnation_limit=5
+    )
+    strategy.update([PATH], [30], PATH, 30)
+    tau_max = 30**0.7 / 0.1
+
+    for _ in range(4):
+        strategy.update([PATH[:2]], [10], PATH, 30)
+    assert strategy.get(*EDGES[-1]) < tau_max
+
+    strategy.update([PATH[:2]], [10], PATH, 30)
+    assert get_values(strategy) == pytest.approx([tau_max] * 3)